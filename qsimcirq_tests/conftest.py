@@ -0,0 +1,51 @@
+# Copyright 2019 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import cirq
+import pytest
+import qsimcirq
+
+
+@pytest.fixture(scope="session")
+def qsim_sim():
+    """A default QSimSimulator shared across tests.
+
+    Simulator construction pays pybind/module-load overhead that dominates
+    the small circuits used in these tests, so it is amortized session-wide.
+    Fusing up to four qubits per gate kernel reduces the number of
+    state-vector passes; tests that exercise a specific fusion level build
+    their own simulator.
+    """
+    options = qsimcirq.QSimOptions(
+        max_fused_gate_size=4, cpu_threads=max(1, os.cpu_count() // 2)
+    )
+    return qsimcirq.QSimSimulator(qsim_options=options)
+
+
+@pytest.fixture(scope="session")
+def cirq_sim():
+    """A default cirq.Simulator shared across tests."""
+    return cirq.Simulator()
+
+
+@pytest.fixture
+def seeded_qsim_sim():
+    """A QSimSimulator with a fixed seed, to minimize flaky trajectory tests.
+
+    Function-scoped so every test starts at the top of the seeded random
+    stream, keeping results independent of test selection and ordering.
+    """
+    return qsimcirq.QSimSimulator(seed=1)